@@ -3,9 +3,11 @@ import pandas as pd
 import plotly.express as px
 from datetime import datetime, timedelta, time, date
 import gspread
+from gspread.utils import rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="My Routine OS", page_icon="☁️", layout="wide")
@@ -13,6 +15,16 @@ st.set_page_config(page_title="My Routine OS", page_icon="☁️", layout="wide"
 # --- CONFIGURATION ---
 SHEET_URL = "https://docs.google.com/spreadsheets/d/1fYu8ws8PZF-36oseUNXvcoT_zO0xVfYbL6vScYWbhdk/edit"
 
+# Sheet headers (in column order) and the dtype each column is loaded as
+TASKS_SCHEMA = {
+    "Task": "object", "Category": "category", "Location": "category", "Date": "object",
+    "StartTime": "object", "Duration": "int32", "Priority": "category", "Status": "category",
+    "Notes": "object",
+}
+TRAVEL_SCHEMA = {"Date": "object", "From": "object", "To": "object", "DistanceKM": "float64", "Mode": "category"}
+SCHEMAS = {"Tasks": TASKS_SCHEMA, "Travel": TRAVEL_SCHEMA}
+MAX_DURATION_MINS = 24 * 60
+
 # --- TIMEZONE HANDLER (BANGLADESH) ---
 def get_bd_time():
     """Returns the current time in Bangladesh (UTC+6)"""
@@ -23,6 +35,7 @@ def get_bd_date():
     return get_bd_time().date()
 
 # --- GOOGLE SHEETS CONNECTION HANDLER ---
+@st.cache_resource
 def get_google_sheet_client():
     scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
     
@@ -39,57 +52,114 @@ def get_google_sheet_client():
     client = gspread.authorize(creds)
     return client
 
-def init_sheets():
+@st.cache_resource
+def get_spreadsheet():
+    """Opens the spreadsheet once and reuses the handle across reruns"""
     client = get_google_sheet_client()
-    sheet = client.open_by_url(SHEET_URL)
+    return client.open_by_url(SHEET_URL)
+
+@st.cache_resource
+def get_ws(name):
+    """Returns a cached worksheet handle so lookups don't hit the API again"""
+    return get_spreadsheet().worksheet(name)
+
+@st.cache_resource
+def init_sheets():
+    sheet = get_spreadsheet()
+    # One worksheets() call lists every tab, so existence checks are local
+    titles = {ws.title for ws in sheet.worksheets()}
     
-    try:
-        ws_tasks = sheet.worksheet("Tasks")
-    except:
+    if "Tasks" not in titles:
         ws_tasks = sheet.add_worksheet(title="Tasks", rows=1000, cols=10)
-        ws_tasks.append_row(["Task", "Category", "Location", "Date", "StartTime", "Duration", "Priority", "Status", "Notes"])
+        ws_tasks.append_row(list(TASKS_SCHEMA))
         
-    try:
-        ws_travel = sheet.worksheet("Travel")
-    except:
+    if "Travel" not in titles:
         ws_travel = sheet.add_worksheet(title="Travel", rows=1000, cols=6)
-        ws_travel.append_row(["Date", "From", "To", "DistanceKM", "Mode"])
+        ws_travel.append_row(list(TRAVEL_SCHEMA))
         
     return sheet
 
-def load_data(worksheet_name):
+def empty_frame(worksheet_name):
+    """An empty, already-typed frame for a worksheet"""
+    schema = SCHEMAS[worksheet_name]
+    df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in schema.items()})
+    return df.set_index('Date', drop=False)
+
+def build_frame(worksheet_name, rows):
+    """Turns the raw 2-D values of a worksheet into a typed DataFrame"""
+    schema = SCHEMAS[worksheet_name]
     try:
-        sheet = init_sheets()
-        worksheet = sheet.worksheet(worksheet_name)
-        data = worksheet.get_all_records()
-        df = pd.DataFrame(data)
-        
-        expected_cols = ["Task", "Category", "Location", "Date", "StartTime", "Duration", "Priority", "Status", "Notes"]
+        if len(rows) < 2:
+            return empty_frame(worksheet_name)
+
+        # Pad any short rows so they line up with the header
+        width = len(rows[0])
+        body = [row + [''] * (width - len(row)) for row in rows[1:]]
+        df = pd.DataFrame(body, columns=rows[0])
+        # Extra populated columns past the header all come back titled '', so keep only the first of each label
+        df = df.loc[:, ~df.columns.duplicated()]
+        # Align to the schema in one pass: missing columns come back blank, extras are dropped
+        df = df.reindex(columns=list(schema), fill_value='')
+
         if worksheet_name == "Tasks":
-            for col in expected_cols:
-                if col not in df.columns:
-                    df[col] = pd.Series(dtype='object')
+            # Remember each task's sheet row (header + 0-based) before any filtering
+            df['SheetRow'] = df.index + 2
 
-        if not df.empty and 'Date' in df.columns:
-            df = df[df['Date'] != ''] 
-            df['Date'] = pd.to_datetime(df['Date']).dt.date
-            
-        return df
+        df['Date'] = pd.to_datetime(df['Date'], format="%Y-%m-%d", errors='coerce').dt.date
+        df = df[df['Date'].notna()]
+
+        # Sheet values come back as raw strings, so blanks become 0 before the numeric cast
+        for col in ["Duration", "DistanceKM"]:
+            if col in schema:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        df = df.astype(schema)
+
+        # Parse start/end times once here instead of per row while rendering
+        if worksheet_name == "Tasks":
+            df['StartDT'] = pd.to_datetime(df['StartTime'], format="%H:%M", errors='coerce')
+            df['EndDT'] = df['StartDT'] + pd.to_timedelta(df['Duration'], unit='m')
+            df['TimeRange'] = (df['StartDT'].dt.strftime('%I:%M %p') + " - " +
+                               df['EndDT'].dt.strftime('%I:%M %p')).fillna("Time Error")
+
+        # Index by date so per-day views are index lookups rather than full scans
+        return df.set_index('Date', drop=False).sort_index()
     except Exception as e:
-        return pd.DataFrame(columns=["Task", "Category", "Location", "Date", "StartTime", "Duration", "Priority", "Status", "Notes"])
+        return empty_frame(worksheet_name)
 
-def save_entry(worksheet_name, entry_dict):
-    sheet = init_sheets()
-    worksheet = sheet.worksheet(worksheet_name)
-    
-    row_values = list(entry_dict.values())
-    row_values_str = [str(x) if isinstance(x, (datetime, date, time)) else x for x in row_values]
+def rows_for_date(df, day):
+    """Returns the rows of a date-indexed frame for one day (empty if none)"""
+    try:
+        return df.loc[[day]]
+    except KeyError:
+        return df.iloc[0:0]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_data(worksheet_name):
+    """Fetches one worksheet; cached per sheet so a mutation only refetches what it changed"""
+    # Errors are left to propagate: st.cache_data doesn't cache exceptions, so a failed fetch is retried next run
+    rows = get_ws(worksheet_name).get_all_values()
+    return build_frame(worksheet_name, rows)
+
+def load_all_data():
+    """Loads Tasks and Travel with their Sheets requests running side by side"""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {name: pool.submit(load_data, name) for name in ["Tasks", "Travel"]}
     
-    worksheet.append_row(row_values_str)
+    frames = []
+    for name, future in futures.items():
+        try:
+            frames.append(future.result())
+        except Exception:
+            st.error(f"🚨 Could not load the {name} sheet from Google Drive. Refresh to try again.")
+            frames.append(empty_frame(name))
+    return frames
+
+def save_entry(worksheet_name, entry_dict):
+    # append_rows with a single row is the same one values:append request
+    bulk_save_entries(worksheet_name, [entry_dict])
 
 def bulk_save_entries(worksheet_name, list_of_dicts):
-    sheet = init_sheets()
-    worksheet = sheet.worksheet(worksheet_name)
+    worksheet = get_ws(worksheet_name)
     
     rows_to_add = []
     for entry in list_of_dicts:
@@ -98,65 +168,86 @@ def bulk_save_entries(worksheet_name, list_of_dicts):
         
     worksheet.append_rows(rows_to_add)
 
-def update_status_in_sheet(task_name, date_str, new_status):
-    sheet = init_sheets()
-    ws = sheet.worksheet("Tasks")
-    try:
-        cell_list = ws.findall(task_name)
-        for cell in cell_list:
-            # Column 4 is Date
-            date_cell = ws.cell(cell.row, 4) 
-            if date_cell.value == str(date_str):
-                # Column 8 is Status
-                ws.update_cell(cell.row, 8, new_status)
-    except:
-        st.warning("Could not update status. Task might be duplicated or not found.")
-
-def delete_task_from_sheet(task_name, date_obj, time_str):
-    """Finds a task by Name + Date + Time and deletes the row."""
-    sheet = init_sheets()
-    ws = sheet.worksheet("Tasks")
+def task_key(row):
+    """Identifies a loaded task by sheet row plus the fields that must still match at sync time."""
+    return (int(row.SheetRow), row.Task, str(row.Date), row.StartTime)
+
+def describe_tasks(keys):
+    """Formats task keys for a warning message"""
+    return ", ".join(f"{task} ({date_str} {start})" for _, task, date_str, start in keys)
+
+def queue_status_update(key, new_status):
+    """Queues a status change locally; it is written on the next sync."""
+    st.session_state.pending_updates[key] = new_status
+
+def queue_task_delete(key):
+    """Queues a task row for deletion on the next sync."""
+    st.session_state.pending_deletes.add(key)
+
+def sync_pending_changes(pending_updates, pending_deletes):
+    """Writes queued status changes and deletions, one batch request each.
     
-    cell_list = ws.findall(task_name)
+    Each queued row is re-read first and only touched if its Task, Date and StartTime
+    still match what was queued. Returns the keys that no longer matched and were skipped.
+    """
+    sheet = get_spreadsheet()
+    columns = list(TASKS_SCHEMA)
+    last_col = rowcol_to_a1(1, len(columns))[:-1]
     
-    for cell in cell_list:
-        row_num = cell.row
-        row_values = ws.row_values(row_num)
-        
-        try:
-            # Columns in sheet are 1-indexed. Date is col 4, StartTime is col 5.
-            # Python list is 0-indexed. Date is index 3, StartTime is index 4.
-            sheet_date = row_values[3] 
-            sheet_time = row_values[4]
-            
-            if sheet_date == str(date_obj) and sheet_time == str(time_str):
-                ws.delete_rows(row_num)
-                return True
-        except IndexError:
-            continue
-            
-    return False
+    keys = sorted(set(pending_updates) | pending_deletes)
+    if not keys:
+        return []
+    
+    # One batchGet re-reads every queued row so rows shifted by edits elsewhere are caught
+    result = sheet.values_batch_get([f"Tasks!A{row}:{last_col}{row}" for row, _, _, _ in keys])
+    matched = set()
+    for key, value_range in zip(keys, result.get("valueRanges", [])):
+        values = (value_range.get("values") or [[]])[0]
+        values = values + [''] * (len(columns) - len(values))
+        current = (values[columns.index("Task")], values[columns.index("Date")], values[columns.index("StartTime")])
+        if current == key[1:]:
+            matched.add(key)
+    
+    # Rows that are about to be deleted don't need their status written first
+    updates = {key: status for key, status in pending_updates.items()
+               if key in matched and key not in pending_deletes}
+    if updates:
+        status_col = columns.index("Status") + 1
+        sheet.values_batch_update({
+            "valueInputOption": "RAW",
+            "data": [{"range": f"Tasks!{rowcol_to_a1(key[0], status_col)}", "values": [[status]]}
+                     for key, status in updates.items()]
+        })
+    
+    deletes = [key for key in pending_deletes if key in matched]
+    if deletes:
+        sheet_id = get_ws("Tasks").id
+        # Delete bottom-up so earlier deletions don't shift the rows still to go
+        sheet.batch_update({"requests": [
+            {"deleteDimension": {"range": {"sheetId": sheet_id, "dimension": "ROWS",
+                                           "startIndex": row - 1, "endIndex": row}}}
+            for row, _, _, _ in sorted(deletes, reverse=True)
+        ]})
+    
+    return [key for key in keys if key not in matched]
 
 def add_recurring_schedule(task, cat, loc, start_t, dur, priority, notes, days_selected, weeks_to_plan=4):
     today = get_bd_date()
-    new_entries = []
     
-    for i in range(weeks_to_plan * 7):
-        current_date = today + timedelta(days=i)
-        day_name = current_date.strftime("%A")
-        
-        if day_name in days_selected:
-            new_entries.append({
-                "Task": task,
-                "Category": cat,
-                "Location": loc,
-                "Date": current_date,
-                "StartTime": start_t.strftime("%H:%M"),
-                "Duration": dur,
-                "Priority": priority,
-                "Status": "Pending",
-                "Notes": notes
-            })
+    dates = pd.date_range(today, periods=weeks_to_plan * 7, freq='D')
+    chosen = dates[dates.day_name().isin(days_selected)]
+    
+    new_entries = pd.DataFrame({
+        "Task": task,
+        "Category": cat,
+        "Location": loc,
+        "Date": chosen.date,
+        "StartTime": start_t.strftime("%H:%M"),
+        "Duration": dur,
+        "Priority": priority,
+        "Status": "Pending",
+        "Notes": notes
+    }).to_dict('records')
             
     if new_entries:
         bulk_save_entries("Tasks", new_entries)
@@ -164,19 +255,42 @@ def add_recurring_schedule(task, cat, loc, start_t, dur, priority, notes, days_s
     return 0
 
 # --- APP START ---
-if 'data_loaded' not in st.session_state:
-    with st.spinner("Connecting to Google Drive..."):
-        st.session_state.df = load_data("Tasks")
-        st.session_state.df_travel = load_data("Travel")
-        st.session_state.data_loaded = True
+# Resolve the dates once so every widget in this run agrees on "today"
+TODAY = get_bd_date()
+TMRW = TODAY + timedelta(days=1)
+
+# Finish/Delete clicks are queued here and flushed together by the Sync button
+if 'pending_updates' not in st.session_state:
+    st.session_state.pending_updates = {}
+if 'pending_deletes' not in st.session_state:
+    st.session_state.pending_deletes = set()
+
+with st.spinner("Connecting to Google Drive..."):
+    try:
+        init_sheets()
+    except Exception:
+        st.error("🚨 Could not connect to Google Drive. Check your connection and refresh to try again.")
+        st.stop()
+    df, df_travel = load_all_data()
+
+# Drop queued changes whose task is no longer at that row in the freshly loaded sheet
+if (st.session_state.pending_updates or st.session_state.pending_deletes) and 'SheetRow' in df.columns:
+    loaded_keys = set(zip(df['SheetRow'], df['Task'], df['Date'].astype(str), df['StartTime']))
+    dropped = [key for key in set(st.session_state.pending_updates) | st.session_state.pending_deletes
+               if key not in loaded_keys]
+    if dropped:
+        st.session_state.pending_updates = {key: status for key, status in st.session_state.pending_updates.items()
+                                            if key in loaded_keys}
+        st.session_state.pending_deletes &= loaded_keys
+        st.warning(f"Dropped queued change(s) for tasks that moved or changed in the sheet: {describe_tasks(dropped)}")
 
-df = st.session_state.df
-df_travel = st.session_state.df_travel
+# Today's trips feed both the tracker and the travel log, so slice them once
+today_travel = rows_for_date(df_travel, TODAY)
 
 # --- SIDEBAR: NEW INPUT FORM ---
 with st.sidebar:
     st.header("📝 Create Routine")
-    st.caption(f"📅 BD Date: {get_bd_date()}")
+    st.caption(f"📅 BD Date: {TODAY}")
     
     is_recurring = st.toggle("🔄 Repeating Task?", value=False)
     
@@ -189,10 +303,10 @@ with st.sidebar:
         st.subheader("Time & Schedule")
         col_t1, col_t2 = st.columns(2)
         start_time = col_t1.time_input("Start Time", time(10, 0))
-        duration_mins = col_t2.number_input("Duration (Mins)", min_value=15, value=60, step=15)
+        duration_mins = col_t2.number_input("Duration (Mins)", min_value=15, max_value=MAX_DURATION_MINS, value=60, step=15)
         
         days = []
-        specific_date = get_bd_date()
+        specific_date = TODAY
         
         if is_recurring:
             st.write("Repeating Days:")
@@ -206,7 +320,7 @@ with st.sidebar:
             if c6.checkbox("Sat"): days.append("Saturday")
             if c7.checkbox("Sun"): days.append("Sunday")
         else:
-            specific_date = st.date_input("Date", get_bd_date())
+            specific_date = st.date_input("Date", TODAY)
         
         st.subheader("Details")
         priority = st.select_slider("Priority", options=["Low", "Medium", "High"], value="Medium")
@@ -234,15 +348,38 @@ with st.sidebar:
                     save_entry("Tasks", new_entry)
                     st.success("Task Added!")
                 
-                del st.session_state.data_loaded
+                load_data.clear("Tasks")
                 st.rerun()
 
 # --- MAIN DASHBOARD ---
 st.title("🚀 My Daily Driver (Cloud)")
 
+skipped = st.session_state.pop('sync_skipped', [])
+if skipped:
+    st.warning(f"Skipped change(s) for tasks that moved or changed in the sheet: {describe_tasks(skipped)}")
+
+pending_count = len(st.session_state.pending_updates) + len(st.session_state.pending_deletes)
+if pending_count:
+    col_sync_msg, col_sync_btn = st.columns([4, 1])
+    col_sync_msg.warning(f"⏳ {pending_count} change(s) waiting to be synced.")
+    if col_sync_btn.button("☁️ Sync Changes"):
+        with st.spinner("Syncing with Google Cloud..."):
+            try:
+                skipped = sync_pending_changes(st.session_state.pending_updates, st.session_state.pending_deletes)
+            except Exception:
+                st.error("Could not sync changes. They are still queued, please try again.")
+            else:
+                st.session_state.pending_updates = {}
+                st.session_state.pending_deletes = set()
+                # Shown after the rerun, since st.rerun discards anything rendered here
+                st.session_state.sync_skipped = skipped
+                load_data.clear("Tasks")
+                st.rerun()
+
 if not df.empty:
-    tmrw = get_bd_date() + timedelta(days=1)
-    tmrw_high = df[(df['Date'] == tmrw) & (df['Priority'] == 'High')].sort_values(by="StartTime")
+    tmrw_tasks = rows_for_date(df, TMRW)
+    # Only the earliest task is shown, so take it in one pass instead of sorting
+    tmrw_high = tmrw_tasks[tmrw_tasks['Priority'] == 'High'].nsmallest(1, 'StartDT')
 else:
     tmrw_high = pd.DataFrame()
 
@@ -260,7 +397,6 @@ with col_alert1:
 with col_alert2:
     st.markdown("### 🚗 Travel Tracker (Today)")
     if not df_travel.empty:
-        today_travel = df_travel[df_travel['Date'] == get_bd_date()]
         total_km = today_travel['DistanceKM'].sum()
     else:
         total_km = 0
@@ -273,10 +409,10 @@ tab_timeline, tab_stats, tab_log, tab_manage = st.tabs(["🕒 24-Hour Timeline",
 
 # 1. TIMELINE
 with tab_timeline:
-    selected_date = st.date_input("View Schedule For:", get_bd_date())
+    selected_date = st.date_input("View Schedule For:", TODAY)
     
     if not df.empty:
-        daily_tasks = df[df['Date'] == selected_date].sort_values(by="StartTime")
+        daily_tasks = rows_for_date(df, selected_date).sort_values(by="StartTime")
     else:
         daily_tasks = pd.DataFrame()
     
@@ -285,38 +421,30 @@ with tab_timeline:
     else:
         st.markdown(f"### Agenda for {selected_date.strftime('%A, %d %B')}")
         
-        for index, row in daily_tasks.iterrows():
-            try:
-                start_dt = datetime.strptime(row['StartTime'], "%H:%M")
-                end_dt = start_dt + timedelta(minutes=row['Duration'])
-                time_str = f"{start_dt.strftime('%I:%M %p')} - {end_dt.strftime('%I:%M %p')}"
-            except:
-                time_str = "Time Error"
-
-            border_color = "red" if row['Priority'] == "High" else "#ddd"
-            bg_color = "rgba(255, 0, 0, 0.05)" if row['Priority'] == "High" else "transparent"
+        for row in daily_tasks.itertuples(index=False):
+            border_color = "red" if row.Priority == "High" else "#ddd"
+            bg_color = "rgba(255, 0, 0, 0.05)" if row.Priority == "High" else "transparent"
             
             with st.container():
                 c1, c2, c3 = st.columns([1, 4, 1])
                 with c1:
-                    st.markdown(f"**{time_str}**")
+                    st.markdown(f"**{row.TimeRange}**")
                 
                 with c2:
                     st.markdown(f"""
                     <div style="border-left: 5px solid {border_color}; padding-left: 10px; background-color: {bg_color};">
-                        <h4 style="margin:0">{row['Task']} <span style="font-size:0.8em; color:gray; font-weight:normal">({row['Category']})</span></h4>
-                        <p style="margin:0; font-size:0.95em">📍 <b>{row['Location']}</b></p>
-                        <p style="margin-top:4px; font-size:0.85em; font-style:italic; color:#555">📝 {row['Notes']}</p>
+                        <h4 style="margin:0">{row.Task} <span style="font-size:0.8em; color:gray; font-weight:normal">({row.Category})</span></h4>
+                        <p style="margin:0; font-size:0.95em">📍 <b>{row.Location}</b></p>
+                        <p style="margin-top:4px; font-size:0.85em; font-style:italic; color:#555">📝 {row.Notes}</p>
                     </div>
                     """, unsafe_allow_html=True)
                 
                 with c3:
-                    if row['Status'] != "Done":
-                        if st.button("Finish", key=f"fin_{index}"):
-                            with st.spinner("Updating..."):
-                                update_status_in_sheet(row['Task'], row['Date'], "Done")
-                                del st.session_state.data_loaded
-                                st.rerun()
+                    if task_key(row) in st.session_state.pending_updates:
+                        st.write("⏳")
+                    elif row.Status != "Done":
+                        st.button("Finish", key=f"fin_{row.SheetRow}",
+                                  on_click=queue_status_update, args=(task_key(row), "Done"))
                     else:
                         st.write("✅")
 
@@ -341,50 +469,46 @@ with tab_log:
         
         if st.form_submit_button("Log Trip"):
             new_trip = {
-                "Date": get_bd_date(),
+                "Date": TODAY,
                 "From": t_from,
                 "To": t_to,
                 "DistanceKM": t_km,
                 "Mode": "Commute"
             }
             save_entry("Travel", new_trip)
-            del st.session_state.data_loaded
+            load_data.clear("Travel")
             st.rerun()
             
     if not df_travel.empty:
-        st.dataframe(df_travel[df_travel['Date'] == get_bd_date()], hide_index=True)
+        st.dataframe(today_travel, hide_index=True)
 
 # 4. MANAGE (DELETE)
 with tab_manage:
     st.subheader("Manage Tasks (Delete)")
     
-    manage_date = st.date_input("Select Date to Edit:", get_bd_date(), key="manage_date")
+    manage_date = st.date_input("Select Date to Edit:", TODAY, key="manage_date")
     
     if not df.empty:
-        tasks_to_edit = df[df['Date'] == manage_date].sort_values(by="StartTime")
+        tasks_to_edit = rows_for_date(df, manage_date).sort_values(by="StartTime")
         
         if tasks_to_edit.empty:
             st.info("No tasks scheduled for this day.")
         else:
-            for index, row in tasks_to_edit.iterrows():
+            for row in tasks_to_edit.itertuples(index=False):
                 col_det, col_del = st.columns([4, 1])
                 
                 with col_det:
-                    st.markdown(f"**{row['StartTime']}** — {row['Task']}")
-                    st.caption(f"📍 {row['Location']} | 📂 {row['Category']}")
-                    if row['Notes']:
-                        st.caption(f"📝 {row['Notes']}")
+                    st.markdown(f"**{row.StartTime}** — {row.Task}")
+                    st.caption(f"📍 {row.Location} | 📂 {row.Category}")
+                    if row.Notes:
+                        st.caption(f"📝 {row.Notes}")
                 
                 with col_del:
-                    if st.button("🗑️ Delete", key=f"del_{index}"):
-                        with st.spinner("Deleting from Cloud..."):
-                            success = delete_task_from_sheet(row['Task'], row['Date'], row['StartTime'])
-                            if success:
-                                st.success("Deleted!")
-                                del st.session_state.data_loaded
-                                st.rerun()
-                            else:
-                                st.error("Could not find task in sheet.")
+                    if task_key(row) in st.session_state.pending_deletes:
+                        st.caption("⏳ Queued for deletion")
+                    else:
+                        st.button("🗑️ Delete", key=f"del_{row.SheetRow}",
+                                  on_click=queue_task_delete, args=(task_key(row),))
                                 
     else:
         st.write("Database is empty.")